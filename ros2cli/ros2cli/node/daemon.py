@@ -42,6 +42,29 @@ def is_daemon_running(args):
     return False
 
 
+def _wait_for(predicate, *, timeout=None, period=0.1):
+    """
+    Poll a predicate until it holds or a timeout expires.
+
+    :param predicate: callable returning whether to stop waiting.
+    :param timeout: optional duration, in seconds, to wait for.
+      If None, wait indefinitely.
+    :param period: polling period, in seconds.
+    :return: whether the predicate holds.
+    """
+    if timeout is None:
+        while not predicate():
+            time.sleep(period)
+        return True
+    deadline = time.monotonic_ns() + int(timeout * 1e9)
+    while not predicate():
+        now = time.monotonic_ns()
+        if now >= deadline:
+            return False
+        time.sleep(min(period, (deadline - now) / 1e9))
+    return True
+
+
 def spawn_daemon(args, wait_until_spawned=None, debug=False):
     ros_domain_id = int(os.environ.get('ROS_DOMAIN_ID', 0))
     kwargs = {}
@@ -84,16 +107,11 @@ def spawn_daemon(args, wait_until_spawned=None, debug=False):
     if wait_until_spawned is None:
         return True
 
-    if wait_until_spawned > 0.0:
-        timeout = time.time() + wait_until_spawned
-    else:
-        timeout = None
-    while True:
-        if is_daemon_running(args):
-            return True
-        time.sleep(0.1)
-        if timeout is not None and time.time() >= timeout:
-            return None
+    if wait_until_spawned <= 0.0:
+        wait_until_spawned = None
+    if not _wait_for(lambda: is_daemon_running(args), timeout=wait_until_spawned):
+        return None
+    return True
 
 
 class DaemonNode:
@@ -148,16 +166,9 @@ def shutdown_daemon(args, wait_duration=None):
     if wait_duration is None:
         return not is_daemon_running(args)
 
-    if wait_duration > 0.0:
-        timeout = time.time() + wait_duration
-    else:
-        timeout = None
-
-    while is_daemon_running(args):
-        time.sleep(0.1)
-        if timeout and time.time() >= timeout:
-            return False
-    return True
+    if wait_duration <= 0.0:
+        wait_duration = None
+    return _wait_for(lambda: not is_daemon_running(args), timeout=wait_duration)
 
 
 def add_arguments(parser):
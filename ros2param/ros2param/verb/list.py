@@ -12,9 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from argparse import ArgumentTypeError
 import re
 import sys
+import time
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from rcl_interfaces.srv import DescribeParameters
 from rcl_interfaces.srv import ListParameters
 import rclpy
 from ros2cli.node.direct import DirectNode
@@ -23,11 +31,121 @@ from ros2cli.node.strategy import NodeStrategy
 from ros2node.api import get_absolute_node_name
 from ros2node.api import get_node_names
 from ros2node.api import NodeNameCompleter
-from ros2param.api import call_describe_parameters
 from ros2param.api import get_parameter_type_string
 from ros2param.verb import VerbExtension
 from ros2service.api import get_service_names
 
+# time to wait for parameter services to be ready and respond, shared by all nodes
+_SERVICE_TIMEOUT_SEC = 5.0
+
+# a regex literal without special characters, allowing only escaped dots
+_LITERAL = r'((?:[A-Za-z0-9_/~:-]|\\\.)+)'
+_EXACT_LITERAL_PATTERN = re.compile(r'\^' + _LITERAL + r'\$')
+_PREFIX_LITERAL_PATTERN = re.compile(r'\^?' + _LITERAL)
+
+_MAX_FILTER_LENGTH = 512
+
+
+def _iter_subpatterns(value):
+    """Yield the subpatterns nested in the argument of a parsed regex item."""
+    if isinstance(value, sre_parse.SubPattern):
+        yield value
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _iter_subpatterns(item)
+
+
+def _has_nested_unbounded_repeat(subpattern, *, in_repeat=False):
+    """Check if an unbounded repeat contains another one, e.g. `(a+)+`."""
+    for op, av in subpattern:
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and \
+                av[1] == sre_parse.MAXREPEAT:
+            if in_repeat or _has_nested_unbounded_repeat(av[2], in_repeat=True):
+                return True
+            continue
+        for nested in _iter_subpatterns(av):
+            if _has_nested_unbounded_repeat(nested, in_repeat=in_repeat):
+                return True
+    return False
+
+
+def compile_filter_regex(string):
+    """Compile a --filter regex, rejecting patterns prone to catastrophic backtracking."""
+    if len(string) >= _MAX_FILTER_LENGTH:
+        raise ArgumentTypeError(
+            f'regex must be shorter than {_MAX_FILTER_LENGTH} characters')
+    try:
+        parsed = sre_parse.parse(string)
+        regex = re.compile(string)
+    except re.error as e:
+        raise ArgumentTypeError(f'invalid regex: {e}')
+    if _has_nested_unbounded_repeat(parsed):
+        raise ArgumentTypeError('regex must not contain nested unbounded quantifiers')
+    return regex
+
+
+def _get_name_filter(regex_filter):
+    """
+    Get a predicate equivalent to `regex_filter.match` for parameter names.
+
+    Patterns which are plain literals, e.g. `^name$` or `^prefix`, are turned
+    into a set lookup or a prefix check to avoid running the regex engine.
+    """
+    match = _EXACT_LITERAL_PATTERN.fullmatch(regex_filter.pattern)
+    if match:
+        literals = {match.group(1).replace('\\.', '.')}
+        return literals.__contains__
+    match = _PREFIX_LITERAL_PATTERN.fullmatch(regex_filter.pattern)
+    if match:
+        prefix = match.group(1).replace('\\.', '.')
+        return lambda name: name.startswith(prefix)
+    return regex_filter.match
+
+
+def _call_async_when_ready(clients, requests, *, timeout_sec):
+    """
+    Call each client with its request as soon as its service is ready.
+
+    Clients and requests are keyed by the full name of their node.
+    All services share a single deadline. Services that are not ready in time
+    are reported on stderr and left out of the returned futures.
+    """
+    futures = {}
+    pending = []
+    # call services which are ready already before waiting on the others
+    for full_name, client in clients.items():
+        if client.service_is_ready():
+            futures[full_name] = client.call_async(requests[full_name])
+        else:
+            pending.append(full_name)
+
+    deadline = time.monotonic() + timeout_sec
+    for full_name in pending:
+        client = clients[full_name]
+        remaining = max(0.0, deadline - time.monotonic())
+        if not client.wait_for_service(timeout_sec=remaining):
+            print(
+                'Wait for service timed out for node '
+                f"'{full_name}'", file=sys.stderr)
+            continue
+        futures[full_name] = client.call_async(requests[full_name])
+    return futures
+
+
+def _spin_until_futures_complete(node, futures, *, timeout_sec):
+    """Spin the node until all futures are done or the timeout expires."""
+    pending = set()
+    for future in futures:
+        if not future.done():
+            pending.add(future)
+            future.add_done_callback(pending.discard)
+    deadline = time.monotonic() + timeout_sec
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0.0:
+            break
+        rclpy.spin_once(node, timeout_sec=min(1.0, remaining))
+
 
 class ListVerb(VerbExtension):
     """Output a list of available parameters."""
@@ -39,7 +157,7 @@ class ListVerb(VerbExtension):
         arg.completer = NodeNameCompleter(
             include_hidden_nodes_key='include_hidden_nodes')
         parser.add_argument(
-            '--filter', nargs=1,
+            '--filter', nargs=1, type=compile_filter_regex,
             help=(
                 'Only parameters matching the regex expression will be showed.'
                 ' Supports `re` regex syntax.'))
@@ -60,78 +178,95 @@ class ListVerb(VerbExtension):
 
         node_name = get_absolute_node_name(args.node_name)
         if node_name:
-            if node_name not in [n.full_name for n in node_names]:
+            by_full_name = {n.full_name: n for n in node_names}
+            if node_name not in by_full_name:
                 return 'Node not found'
-            node_names = [
-                n for n in node_names if node_name == n.full_name]
+            node_names = [by_full_name[node_name]]
 
         regex_filter = getattr(args, 'filter')
         if regex_filter is not None:
-            regex_filter = re.compile(regex_filter[0])
+            regex_filter = _get_name_filter(regex_filter[0])
 
         with DirectNode(args) as node:
-            service_names = get_service_names(
-                node=node, include_hidden_services=args.include_hidden_nodes)
+            service_names = frozenset(get_service_names(
+                node=node, include_hidden_services=args.include_hidden_nodes))
 
             clients = {}
-            futures = {}
             # create clients for nodes which have the service
             for node_name in node_names:
                 service_name = f'{node_name.full_name}/list_parameters'
                 if service_name in service_names:
                     client = node.create_client(ListParameters, service_name)
-                    clients[node_name] = client
-
-            # wait until all clients have been called
-            while True:
-                for node_name in [
-                    n for n in clients.keys() if n not in futures
-                ]:
-                    # call as soon as ready
-                    client = clients[node_name]
-                    if client.service_is_ready():
-                        request = ListParameters.Request()
-                        for prefix in args.param_prefixes:
-                            request.prefixes.append(prefix)
-                        future = client.call_async(request)
-                        futures[node_name] = future
-
-                if len(futures) == len(clients):
-                    break
-                rclpy.spin_once(node, timeout_sec=1.0)
+                    clients[node_name.full_name] = client
+
+            # call all services as soon as they are ready, the request is
+            # serialized when it is sent so it can be shared by all clients
+            request = ListParameters.Request()
+            request.prefixes = args.param_prefixes
+            requests = dict.fromkeys(clients.keys(), request)
+            futures = _call_async_when_ready(clients, requests, timeout_sec=_SERVICE_TIMEOUT_SEC)
 
             # wait for all responses
-            for future in futures.values():
-                rclpy.spin_until_future_complete(node, future, timeout_sec=1.0)
+            _spin_until_futures_complete(node, futures.values(), timeout_sec=_SERVICE_TIMEOUT_SEC)
 
-            # print responses
-            for node_name in sorted(futures.keys()):
-                future = futures[node_name]
+            # filter the parameter names of each node
+            node_to_names = {}
+            for full_name in sorted(futures.keys()):
+                future = futures[full_name]
                 if future.result() is None:
                     e = future.exception()
                     print(
                         'Exception while calling service of node '
-                        f"'{node_name.full_name}': {e}", file=sys.stderr)
+                        f"'{full_name}': {e}", file=sys.stderr)
                     continue
                 response = future.result()
-                sorted_names = sorted(response.result.names)
+                names = response.result.names
                 if regex_filter is not None:
-                    sorted_names = [name for name in sorted_names if regex_filter.match(name)]
-                if not args.node_name and sorted_names:
-                    print(f'{node_name.full_name}:')
-                # get descriptors for the node if needs to print parameter type
+                    names = [name for name in names if regex_filter(name)]
+                node_to_names[full_name] = sorted(names)
+
+            # get descriptors for all nodes at once if needs to print parameter type
+            describe_futures = {}
+            if args.param_type is True:
+                describe_clients = {}
+                describe_requests = {}
+                for full_name, sorted_names in node_to_names.items():
+                    if not sorted_names:
+                        continue
+                    describe_clients[full_name] = node.create_client(
+                        DescribeParameters, f'{full_name}/describe_parameters')
+                    request = DescribeParameters.Request()
+                    request.names = sorted_names
+                    describe_requests[full_name] = request
+                describe_futures = _call_async_when_ready(
+                    describe_clients, describe_requests, timeout_sec=_SERVICE_TIMEOUT_SEC)
+                _spin_until_futures_complete(
+                    node, describe_futures.values(), timeout_sec=_SERVICE_TIMEOUT_SEC)
+
+            # print responses
+            for full_name, sorted_names in node_to_names.items():
+                if not sorted_names:
+                    continue
                 name_to_type_map = {}
                 if args.param_type is True:
-                    resp = call_describe_parameters(
-                        node=node, node_name=node_name.full_name,
-                        parameter_names=sorted_names)
-                    for descriptor in resp.descriptors:
-                        name_to_type_map[descriptor.name] = get_parameter_type_string(
-                            descriptor.type)
-
-                for name in sorted_names:
-                    if args.param_type is True:
-                        param_type_str = name_to_type_map[name]
-                        print(f'  {name} (type: {param_type_str})')
-                    else:
-                        print(f'  {name}')
+                    # still list the names if the types could not be described
+                    future = describe_futures.get(full_name)
+                    if future is not None and future.result() is None:
+                        e = future.exception()
+                        print(
+                            'Exception while calling service of node '
+                            f"'{full_name}': {e}", file=sys.stderr)
+                    elif future is not None:
+                        for descriptor in future.result().descriptors:
+                            name_to_type_map[descriptor.name] = get_parameter_type_string(
+                                descriptor.type)
+
+                if args.param_type is True:
+                    lines = [
+                        f"  {name} (type: {name_to_type_map.get(name, 'unknown')})"
+                        for name in sorted_names]
+                else:
+                    lines = [f'  {name}' for name in sorted_names]
+                if not args.node_name:
+                    lines.insert(0, f'{full_name}:')
+                sys.stdout.write('\n'.join(lines) + '\n')
@@ -200,3 +200,79 @@ class TestVerbList(unittest.TestCase):
             text=param_list_command.output,
             strict=True
         ), f'actual output: {param_list_command.output}'
+
+    @launch_testing.markers.retry_on_failure(times=5, delay=1)
+    def test_verb_list_filter_literal(self):
+        with self.launch_param_list_command(
+            arguments=[f'{TEST_NAMESPACE}/{TEST_NODE}', '--filter', '^bool_param$']
+        ) as param_list_command:
+            assert param_list_command.wait_for_shutdown(timeout=TEST_TIMEOUT)
+        assert param_list_command.exit_code == launch_testing.asserts.EXIT_OK
+        assert launch_testing.tools.expect_output(
+            expected_lines=[
+                '  bool_param'],
+            text=param_list_command.output,
+            strict=True
+        ), f'actual output: {param_list_command.output}'
+
+    @launch_testing.markers.retry_on_failure(times=5, delay=1)
+    def test_verb_list_filter_prefix(self):
+        with self.launch_param_list_command(
+            arguments=[f'{TEST_NAMESPACE}/{TEST_NODE}', '--filter', '^foo\\.']
+        ) as param_list_command:
+            assert param_list_command.wait_for_shutdown(timeout=TEST_TIMEOUT)
+        assert param_list_command.exit_code == launch_testing.asserts.EXIT_OK
+        assert launch_testing.tools.expect_output(
+            expected_lines=[
+                '  foo.bar.str_param',
+                '  foo.str_param'],
+            text=param_list_command.output,
+            strict=True
+        ), f'actual output: {param_list_command.output}'
+
+    @launch_testing.markers.retry_on_failure(times=5, delay=1)
+    def test_verb_list_param_type(self):
+        with self.launch_param_list_command(
+            arguments=[f'{TEST_NAMESPACE}/{TEST_NODE}', '--filter', 'bool.*', '--param-type']
+        ) as param_list_command:
+            assert param_list_command.wait_for_shutdown(timeout=TEST_TIMEOUT)
+        assert param_list_command.exit_code == launch_testing.asserts.EXIT_OK
+        assert launch_testing.tools.expect_output(
+            expected_lines=[
+                '  bool_array_param (type: boolean array)',
+                '  bool_param (type: boolean)'],
+            text=param_list_command.output,
+            strict=True
+        ), f'actual output: {param_list_command.output}'
+
+    def test_verb_list_filter_invalid_regex(self):
+        with self.launch_param_list_command(
+            arguments=[f'{TEST_NAMESPACE}/{TEST_NODE}', '--filter', '[']
+        ) as param_list_command:
+            assert param_list_command.wait_for_shutdown(timeout=TEST_TIMEOUT)
+        assert param_list_command.exit_code != launch_testing.asserts.EXIT_OK
+        assert 'invalid regex' in param_list_command.output, \
+            f'actual output: {param_list_command.output}'
+
+    def test_verb_list_filter_nested_quantifiers(self):
+        with self.launch_param_list_command(
+            arguments=[f'{TEST_NAMESPACE}/{TEST_NODE}', '--filter', '((a+))+$']
+        ) as param_list_command:
+            assert param_list_command.wait_for_shutdown(timeout=TEST_TIMEOUT)
+        assert param_list_command.exit_code != launch_testing.asserts.EXIT_OK
+        assert 'regex must not contain nested unbounded quantifiers' in \
+            param_list_command.output, f'actual output: {param_list_command.output}'
+
+    @launch_testing.markers.retry_on_failure(times=5, delay=1)
+    def test_verb_list_filter_quantified_group(self):
+        with self.launch_param_list_command(
+            arguments=[f'{TEST_NAMESPACE}/{TEST_NODE}', '--filter', r'(foo\.)+str_param']
+        ) as param_list_command:
+            assert param_list_command.wait_for_shutdown(timeout=TEST_TIMEOUT)
+        assert param_list_command.exit_code == launch_testing.asserts.EXIT_OK
+        assert launch_testing.tools.expect_output(
+            expected_lines=[
+                '  foo.str_param'],
+            text=param_list_command.output,
+            strict=True
+        ), f'actual output: {param_list_command.output}'